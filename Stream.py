@@ -2,75 +2,258 @@ import sqlite3
 import pandas as pd
 import streamlit as st
 from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
 from io import BytesIO
+from itertools import islice
+from pathlib import Path
+import atexit
 import os
+import threading
+
+# Optional: apsw is a thinner wrapper around the SQLite C API than stdlib
+# sqlite3 (less per-execute overhead, zero-copy blobs); fall back to stdlib
+try:
+    import apsw
+except ImportError:
+    apsw = None
+
+# Optional: polars writes Excel natively (Rust) and is much faster than
+# pandas' per-cell xlsxwriter loop on large exports
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# All databases live under data/, created once at import; db_path memoizes the
+# join so the hot paths stop recomputing it on every rerun
+DB_DIR = Path('data')
+DB_DIR.mkdir(exist_ok=True)
+
+@lru_cache(maxsize=None)
+def db_path(db_name):
+    return DB_DIR / db_name
+
+# Single SQL string object so SQLite's per-connection statement cache
+# reuses the compiled statement across calls
+INSERT_SQL = '''INSERT INTO work_entries (date, client_name, client_location, work_of_visit,
+                      requirements, note, hours_worked) VALUES (?, ?, ?, ?, ?, ?, ?)'''
+
+# Schema DDL, shared by init_db and clear_data
+CREATE_SQL = '''CREATE TABLE IF NOT EXISTS work_entries (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        date TEXT,
+                        client_name TEXT,
+                        client_location TEXT,
+                        work_of_visit TEXT,
+                        requirements TEXT,
+                        note TEXT,
+                        hours_worked REAL)'''
+INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_date ON work_entries(date)",
+    "CREATE INDEX IF NOT EXISTS idx_client_name ON work_entries(client_name)",
+)
+
+# Function to list all database files in the current directory. Cached so
+# reruns skip the directory scan; Create/Rename/Delete call .clear() to refresh.
+@st.cache_data(ttl=60)
+def list_databases():
+    return [entry.name for entry in os.scandir(DB_DIR) if entry.name.endswith(".db")]
 
 # Initialize session state for database management
 if 'databases' not in st.session_state:
-    st.session_state.databases = [db for db in os.listdir() if db.endswith(".db")]
+    st.session_state.databases = list_databases()
 
-# Function to list all database files in the current directory
-def list_databases():
-    return [db for db in os.listdir() if db.endswith(".db")]
+# Close and drop the cached connections for a database (before rename/delete).
+# The reader goes first: only the writer's close can checkpoint the WAL, and it
+# refuses while another connection is still open. Checkpointing explicitly
+# folds the WAL into the .db so a rename or delete cannot strand committed rows
+# in an orphaned -wal file.
+def close_conn(db_name):
+    conns = st.session_state.get('conn', {})
+    for readonly in (True, False):
+        conn = conns.pop((db_name, readonly), None)
+        if conn is not None:
+            if not readonly:
+                with _write_lock:
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.close()
 
 # Function to rename database
 def rename_database(old_name, new_name):
     if not new_name.endswith('.db'):
         new_name = f"{new_name}.db"
     try:
-        os.rename(old_name, new_name)
+        close_conn(old_name)
+        os.rename(db_path(old_name), db_path(new_name))
         return True
     except Exception as e:
         st.error(f"Error renaming database: {str(e)}")
         return False
 
+# Apply per-connection performance pragmas. journal_mode=WAL persists on disk
+# (init_db sets it), so other connections only need the session-level pragmas.
+def apply_pragmas(conn):
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    # Memory-map up to 256 MB of the file so reads skip the pager's
+    # read()+memcpy into its own buffer
+    cursor.execute("PRAGMA mmap_size=268435456")
+
+# WAL allows many readers but only one writer at a time, so all writes go
+# through the shared connection under this lock
+_write_lock = threading.Lock()
+
+# Users can create many databases, so the pool is a bounded LRU: the
+# least-recently-used connection is closed when a new one would overflow it
+MAX_CONNS = 8
+
+# Return a long-lived connection for db_name, lazily created and cached in a
+# session-state LRU so reruns reuse it instead of paying open/pragma/close per
+# call. Readers get a separate read-only connection so they never contend with
+# writes.
+def get_conn(db_name, readonly=False):
+    conns = st.session_state.setdefault('conn', OrderedDict())
+    key = (db_name, readonly)
+    conn = conns.get(key)
+    if conn is None:
+        path = db_path(db_name)
+        if apsw is not None:
+            flags = apsw.SQLITE_OPEN_READONLY if readonly \
+                else apsw.SQLITE_OPEN_READWRITE | apsw.SQLITE_OPEN_CREATE
+            conn = apsw.Connection(str(path), flags=flags, statementcachesize=256)
+        elif readonly:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True,
+                                   check_same_thread=False, cached_statements=256)
+        else:
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None,
+                                   cached_statements=256)
+        apply_pragmas(conn)
+        conns[key] = conn
+        if len(conns) > MAX_CONNS:
+            _, evicted = conns.popitem(last=False)
+            evicted.close()
+        atexit.register(conn.close)
+    else:
+        conns.move_to_end(key)
+    return conn
+
 # Initialize the Database
 def init_db(db_name):
     if not db_name.endswith('.db'):
         db_name = f"{db_name}.db"
-    conn = sqlite3.connect(db_name)
-    cursor = conn.cursor()
-    cursor.execute(
-        '''CREATE TABLE IF NOT EXISTS work_entries (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        date TEXT,
-                        client_name TEXT,
-                        client_location TEXT,
-                        work_of_visit TEXT,
-                        requirements TEXT,
-                        note TEXT,
-                        hours_worked REAL)'''
-    )
-    conn.commit()
-    conn.close()
+    conn = get_conn(db_name)
+    with _write_lock:
+        # page_size only applies to freshly created files and must be set before
+        # the first table (and before switching to WAL)
+        conn.execute("PRAGMA page_size=8192")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(CREATE_SQL)
+        for sql in INDEX_SQL:
+            conn.execute(sql)
 
 # Other database functions remain the same
 def add_entry(db_name, client_name, client_location, work_of_visit, requirements, note, hours_worked):
-    date = datetime.now().strftime("%Y-%m-%d")
-    conn = sqlite3.connect(db_name)
-    cursor = conn.cursor()
-    cursor.execute('''INSERT INTO work_entries (date, client_name, client_location, work_of_visit, 
-                      requirements, note, hours_worked) VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                   (date, client_name, client_location, work_of_visit, requirements, note, hours_worked))
-    conn.commit()
-    conn.close()
+    # isoformat() gives the same YYYY-MM-DD without strftime's format parsing
+    date = datetime.now().date().isoformat()
+    conn = get_conn(db_name)
+    row = (date, client_name, client_location, work_of_visit, requirements, note, hours_worked)
+    with _write_lock:
+        conn.execute(INSERT_SQL, row)
+    # WAL writes land in the -wal file, so bump the .db mtime for the cache key
+    os.utime(db_path(db_name))
 
-def load_data(db_name):
-    conn = sqlite3.connect(db_name)
-    df = pd.read_sql_query("SELECT * FROM work_entries", conn)
-    conn.close()
+# Rows fetched per batch when streaming a table into a DataFrame
+CHUNK = 10_000
+
+# Insert many (date, client_name, client_location, work_of_visit, requirements,
+# note, hours_worked) rows in one transaction instead of one commit per row.
+def add_entries(db_name, rows):
+    if not rows:
+        return
+    conn = get_conn(db_name)
+    with _write_lock:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(INSERT_SQL, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    os.utime(db_path(db_name))
+
+# Cached by (db_name, mtime): reruns that did not change the DB reuse the
+# already-built frame instead of re-running the SELECT
+@st.cache_data
+def _load_cached(db_name, mtime):
+    conn = get_conn(db_name, readonly=True)
+    # Static column list: apsw invalidates cur.description once a statement
+    # completes, which a zero-row SELECT does during execute()
+    columns = ['id', 'date', 'client_name', 'client_location', 'work_of_visit',
+               'requirements', 'note', 'hours_worked']
+    cur = conn.execute(f"SELECT {', '.join(columns)} FROM work_entries")
+    frames = []
+    # islice rather than fetchmany: works on both sqlite3 and apsw cursors
+    while True:
+        rows = list(islice(cur, CHUNK))
+        if not rows:
+            break
+        frames.append(pd.DataFrame(rows, columns=columns))
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    df = pd.concat(frames, ignore_index=True, copy=False)
+    df['hours_worked'] = pd.to_numeric(df['hours_worked'], downcast='float')
     return df
 
+def load_data(db_name):
+    return _load_cached(db_name, os.path.getmtime(db_path(db_name)))
+
+# on_click callback for the entry form: queue the row and reset the widgets
+def queue_entry():
+    ss = st.session_state
+    date = datetime.now().date().isoformat()
+    ss.setdefault('pending_rows', []).append(
+        (date, ss.entry_client_name, ss.entry_client_location, ss.entry_work_of_visit,
+         ss.entry_requirements, ss.entry_note, ss.entry_hours_worked))
+    for key in ('entry_client_name', 'entry_client_location', 'entry_work_of_visit',
+                'entry_requirements', 'entry_note'):
+        ss[key] = ""
+    ss.entry_hours_worked = 0.0
+
 def clear_data(db_name):
-    conn = sqlite3.connect(db_name)
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM work_entries")
-    conn.commit()
-    conn.close()
+    conn = get_conn(db_name)
+    with _write_lock:
+        # DROP + recreate is O(1) metadata, vs DELETE journalling every row;
+        # also resets the AUTOINCREMENT counter
+        conn.execute("DROP TABLE IF EXISTS work_entries")
+        conn.execute(CREATE_SQL)
+        for sql in INDEX_SQL:
+            conn.execute(sql)
+    os.utime(db_path(db_name))
 
-def export_data(df):
+# Cached by (db_name, mtime, nrows) — cheap keys instead of hashing the whole
+# DataFrame on every rerun; the frame itself comes from the load_data cache
+@st.cache_data
+def export_data(db_name, mtime, nrows):
+    df = load_data(db_name)
     output = BytesIO()
-    df.to_excel(output, index=False, engine="xlsxwriter")
+    wrote = False
+    if pl is not None:
+        try:
+            pl.from_pandas(df).write_excel(output)
+            wrote = True
+        except ImportError:
+            # pl.from_pandas needs pyarrow for object-dtype (TEXT) columns;
+            # fall back to xlsxwriter if only polars is installed
+            output = BytesIO()
+    if not wrote:
+        # constant_memory streams rows out as written instead of buffering the
+        # whole sheet in xlsxwriter's row cache
+        df.to_excel(output, index=False, engine="xlsxwriter",
+                    engine_kwargs={'options': {'constant_memory': True}})
     processed_data = output.getvalue()
     return processed_data
 
@@ -94,6 +277,7 @@ if st.sidebar.button("Create Database"):
             new_db_name = f"{new_db_name}.db"
         if new_db_name not in st.session_state.databases:
             init_db(new_db_name)
+            list_databases.clear()
             st.session_state.databases = list_databases()
             st.sidebar.success(f"🎉 New database '{new_db_name}' created!")
             st.rerun()
@@ -116,6 +300,7 @@ if selected_db:
     if st.sidebar.button("Rename Database"):
         if new_name:
             if rename_database(selected_db, new_name):
+                list_databases.clear()
                 st.session_state.databases = list_databases()
                 st.sidebar.success(f"✅ Database renamed to '{new_name}'!")
                 st.rerun()
@@ -131,7 +316,14 @@ if selected_db:
     if st.sidebar.button("Delete Current Database", type="primary"):
         if st.sidebar.button("Confirm Delete"):
             try:
-                os.remove(selected_db)
+                close_conn(selected_db)
+                os.remove(db_path(selected_db))
+                # Also drop any -wal/-shm sidecars so no "deleted" data
+                # lingers next to a future database with the same name
+                for suffix in ('-wal', '-shm'):
+                    Path(f"{db_path(selected_db)}{suffix}").unlink(missing_ok=True)
+                st.session_state.setdefault('inited', set()).discard(selected_db)
+                list_databases.clear()
                 st.session_state.databases = list_databases()
                 st.sidebar.success("✅ Database deleted successfully!")
                 st.rerun()
@@ -142,43 +334,69 @@ if selected_db:
 if not selected_db:
     st.warning("⚠️ Please select or create a database from the sidebar.")
 else:
-    init_db(selected_db)
+    # Schema is immutable, so only run the DDL once per database per session
+    if selected_db not in st.session_state.setdefault('inited', set()):
+        init_db(selected_db)
+        st.session_state.inited.add(selected_db)
     st.sidebar.markdown(f"**Current Database:** `{selected_db}`")
 
     st.title("🌟 Work Tracker Tool")
     st.markdown("Keep track of your tasks and activities with an intuitive interface!")
 
-    # Add Entry Form
-    with st.form("entry_form", clear_on_submit=True):
-        st.markdown("### 📝 Add New Entry")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            client_name = st.text_input("👤 Client Name", placeholder="Enter the client name")
-            work_of_visit = st.text_input("🔧 Work of Visit", placeholder="Describe the purpose of the visit")
-            requirements = st.text_area("📋 Requirements", placeholder="Enter client requirements")
-        
-        with col2:
-            client_location = st.text_input("📍 Client Location", placeholder="Enter the client's location")
-            hours_worked = st.number_input("⏱️ Hours of Working", min_value=0.0, step=0.5)
-            note = st.text_area("📝 Note", placeholder="Add any additional notes")
-        
-        submitted = st.form_submit_button("Submit ✅")
-
-        if submitted:
-            if client_name and client_location and work_of_visit and requirements and hours_worked > 0:
-                add_entry(selected_db, client_name, client_location, work_of_visit, requirements, note, hours_worked)
-                st.success("🎉 Entry added successfully!")
-            else:
-                st.error("⚠️ All fields are required!")
+    # Add Entry Form — plain widgets rather than st.form, so the submit button
+    # can be disabled reactively and an invalid submit never triggers a rerun
+    st.markdown("### 📝 Add New Entry")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        client_name = st.text_input("👤 Client Name", placeholder="Enter the client name",
+                                    key="entry_client_name")
+        work_of_visit = st.text_input("🔧 Work of Visit", placeholder="Describe the purpose of the visit",
+                                      key="entry_work_of_visit")
+        requirements = st.text_area("📋 Requirements", placeholder="Enter client requirements",
+                                    key="entry_requirements")
+
+    with col2:
+        client_location = st.text_input("📍 Client Location", placeholder="Enter the client's location",
+                                        key="entry_client_location")
+        hours_worked = st.number_input("⏱️ Hours of Working", min_value=0.0, step=0.5,
+                                       key="entry_hours_worked")
+        note = st.text_area("📝 Note", placeholder="Add any additional notes",
+                            key="entry_note")
+
+    fields = {
+        'client_name': client_name,
+        'client_location': client_location,
+        'work_of_visit': work_of_visit,
+        'requirements': requirements,
+    }
+    valid = all(fields.values()) and hours_worked > 0
+    st.button("Submit ✅", disabled=not valid, on_click=queue_entry)
+    if not valid:
+        st.caption("⚠️ Fill in every field to enable Submit.")
+
+    # Flush queued entries in one transaction
+    pending = st.session_state.get('pending_rows', [])
+    if pending:
+        st.info(f"📦 {len(pending)} entr{'y' if len(pending) == 1 else 'ies'} pending")
+        if st.button("Commit batch 💾"):
+            add_entries(selected_db, pending)
+            st.session_state.pending_rows = []
+            st.success("🎉 Batch committed successfully!")
+            st.rerun()
 
     # Display Data Section
     st.markdown("### 📊 View Work Entries")
     data = load_data(selected_db)
     if not data.empty:
-        st.dataframe(data.style.set_properties(**{'text-align': 'left'}), use_container_width=True)
+        # Column-level config instead of a Styler, which builds a CSS dict per cell
+        st.dataframe(
+            data,
+            use_container_width=True,
+            column_config={c: st.column_config.Column(width="auto") for c in data.columns}
+        )
 
-        excel_data = export_data(data)
+        excel_data = export_data(selected_db, os.path.getmtime(db_path(selected_db)), len(data))
         st.download_button(
             label="📥 Export Data to Excel",
             data=excel_data,